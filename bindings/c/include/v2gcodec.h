@@ -48,6 +48,7 @@ enum v2g_status {
   V2G_ERR_DECODE = 5,      /* decode failure */
   V2G_ERR_SCHEMA = 6,      /* schema / grammar error */
   V2G_ERR_OOM = 7,         /* out of memory */
+  V2G_ERR_NOSPACE = 8,     /* caller-provided output buffer too small */
   V2G_ERR_INTERNAL = 254   /* internal/unclassified error */
 };
 
@@ -151,6 +152,66 @@ int v2g_encode_xml(const uint8_t *xml, size_t xml_len, uint8_t **out_exi,
 int v2g_decode_exi(const uint8_t *exi, size_t exi_len, char **out_xml,
                    size_t *out_len);
 
+/*
+ * v2g_encode_xml_into / v2g_decode_exi_into
+ *
+ * Variants of v2g_encode_xml / v2g_decode_exi that write the result into a
+ * caller-owned buffer instead of allocating one, so no v2g_free_buffer call
+ * is needed. The decoded XML is not NUL-terminated.
+ *
+ * Parameters:
+ *   xml / exi - pointer to input bytes
+ *   xml_len / exi_len - length of the input in bytes
+ *   out       - caller-owned output buffer (may be NULL if out_cap is 0)
+ *   out_cap   - capacity of `out` in bytes
+ *   out_len   - pointer to a size_t that receives the length of the result
+ *
+ * Returns:
+ *   V2G_OK on success. V2G_ERR_NOSPACE if the result does not fit in
+ *   `out_cap` bytes; nothing is written to `out` and *out_len holds the
+ *   required size, so the caller can retry with a larger buffer.
+ *   V2G_ERR_NOSPACE does not update v2g_last_error().
+ */
+int v2g_encode_xml_into(const uint8_t *xml, size_t xml_len, uint8_t *out,
+                        size_t out_cap, size_t *out_len);
+int v2g_decode_exi_into(const uint8_t *exi, size_t exi_len, uint8_t *out,
+                        size_t out_cap, size_t *out_len);
+
+/*
+ * v2g_encode_xml_batch / v2g_decode_exi_batch
+ *
+ * Batch variants of v2g_encode_xml / v2g_decode_exi that process `n` inputs
+ * in a single call, amortizing per-call FFI overhead for callers handling
+ * many small messages.
+ *
+ * Parameters:
+ *   xmls / exis - array of `n` pointers to input buffers
+ *   lens        - array of `n` input lengths in bytes
+ *   n           - number of entries in every array
+ *   out_bufs /  - caller-provided array of `n` pointers receiving the
+ *   out_xmls      library-allocated outputs (same format as v2g_encode_xml /
+ *                 v2g_decode_exi)
+ *   out_lens    - caller-provided array of `n` sizes receiving output lengths
+ *
+ * On failure no output buffers remain allocated and the last error message
+ * names the index of the failing entry.
+ *
+ * Memory ownership:
+ *   Caller must call `v2g_free_batch(out, n)` to release all outputs.
+ */
+int v2g_encode_xml_batch(const uint8_t **xmls, const size_t *lens, size_t n,
+                         uint8_t **out_bufs, size_t *out_lens);
+int v2g_decode_exi_batch(const uint8_t **exis, const size_t *lens, size_t n,
+                         char **out_xmls, size_t *out_lens);
+
+/*
+ * v2g_free_batch
+ *
+ * Free every non-NULL buffer in an output array filled by a batch function
+ * and reset the entries to NULL.
+ */
+void v2g_free_batch(void **bufs, size_t n);
+
 /*
  * v2g_free_buffer
  *
@@ -271,8 +332,9 @@ int v2g_decode_struct(int msg_type, const uint8_t *exi_data, size_t exi_len,
  *   msg_type - message type identifier
  *
  * Returns:
- *   NUL-terminated string with the message type name. The string is
- *   dynamically allocated and must be freed with v2g_free_buffer().
+ *   NUL-terminated string with the message type name, or NULL if msg_type is
+ *   not a known message type. The string is owned by the library, valid for
+ *   the lifetime of the process, and must not be freed by the caller.
  */
 const char *v2g_message_type_name(int msg_type);
 
@@ -101,7 +101,12 @@ extern int v2g_shutdown(void);
 extern int v2g_load_schemas(char** paths, size_t count);
 extern int v2g_encode_xml(uint8_t* xml, size_t xml_len, uint8_t** out_exi, size_t* out_len);
 extern int v2g_decode_exi(uint8_t* exiBuf, size_t exi_len, char** out_xml, size_t* out_len);
+extern int v2g_encode_xml_into(uint8_t* xml, size_t xml_len, uint8_t* out, size_t out_cap, size_t* out_len);
+extern int v2g_decode_exi_into(uint8_t* exiBuf, size_t exi_len, uint8_t* out, size_t out_cap, size_t* out_len);
+extern int v2g_encode_xml_batch(uint8_t** xmls, size_t* lens, size_t n, uint8_t** out_bufs, size_t* out_lens);
+extern int v2g_decode_exi_batch(uint8_t** exis, size_t* lens, size_t n, char** out_xmls, size_t* out_lens);
 extern void v2g_free_buffer(void* buf);
+extern void v2g_free_batch(void** bufs, size_t n);
 extern char* v2g_last_error(void);
 extern char* v2g_version(void);
 extern int v2g_set_option(char* name, char* value);
@@ -15,6 +15,7 @@ License: Apache-2.0 (match repository)
 package main
 
 /*
+#include <stdint.h>
 #include <stdlib.h>
 #include <string.h>
 */
@@ -55,6 +56,7 @@ const (
 	_v2g_err_decode   = 5
 	_v2g_err_schema   = 6
 	_v2g_err_oom      = 7
+	_v2g_err_nospace  = 8
 	_v2g_err_internal = 254
 )
 
@@ -264,23 +266,207 @@ func v2g_decode_exi(exiBuf *C.uint8_t, exi_len C.size_t, out_xml **C.char, out_l
 		return C.int(_v2g_err_decode)
 	}
 
-	// Allocate C memory for NUL-terminated string
-	// Use malloc to allocate len+1 bytes and copy contents, set trailing NUL.
-	clen := C.size_t(len(xmlBytes) + 1)
-	cptr := C.malloc(clen)
+	cptr := cStringFromBytes(xmlBytes)
 	if cptr == nil {
 		setLastError("decode: out of memory")
 		return C.int(_v2g_err_oom)
 	}
 
-	// Copy bytes into allocated memory
-	C.memcpy(cptr, unsafe.Pointer(&xmlBytes[0]), C.size_t(len(xmlBytes)))
+	*out_xml = cptr
+	*out_len = C.size_t(len(xmlBytes))
+	return C.int(_v2g_ok)
+}
+
+//export v2g_encode_xml_into
+func v2g_encode_xml_into(xml *C.uint8_t, xml_len C.size_t, out *C.uint8_t, out_cap C.size_t, out_len *C.size_t) C.int {
+	if xml == nil || xml_len == 0 || out_len == nil {
+		setLastError("v2g_encode_xml_into: invalid arguments")
+		return C.int(_v2g_err_invalid)
+	}
+
+	// Ensure codec initialized
+	stateMu.Lock()
+	c := codec
+	stateMu.Unlock()
+	if c == nil {
+		setLastError("v2g_encode_xml_into: codec not initialized")
+		return C.int(_v2g_err_init)
+	}
+
+	input := C.GoBytes(unsafe.Pointer(xml), C.int(xml_len))
+
+	result, err := c.EncodeXML(input)
+	if err != nil {
+		setLastError("encode failed: %v", err)
+		return C.int(_v2g_err_encode)
+	}
+	return copyToCallerBuffer(result, out, out_cap, out_len)
+}
+
+//export v2g_decode_exi_into
+func v2g_decode_exi_into(exiBuf *C.uint8_t, exi_len C.size_t, out *C.uint8_t, out_cap C.size_t, out_len *C.size_t) C.int {
+	if exiBuf == nil || exi_len == 0 || out_len == nil {
+		setLastError("v2g_decode_exi_into: invalid arguments")
+		return C.int(_v2g_err_invalid)
+	}
+
+	// Ensure codec initialized
+	stateMu.Lock()
+	c := codec
+	stateMu.Unlock()
+	if c == nil {
+		setLastError("v2g_decode_exi_into: codec not initialized")
+		return C.int(_v2g_err_init)
+	}
+
+	input := C.GoBytes(unsafe.Pointer(exiBuf), C.int(exi_len))
+
+	xmlBytes, err := c.DecodeEXI(input)
+	if err != nil {
+		setLastError("decode failed: %v", err)
+		return C.int(_v2g_err_decode)
+	}
+	return copyToCallerBuffer(xmlBytes, out, out_cap, out_len)
+}
+
+// copyToCallerBuffer copies b into a caller-owned buffer of out_cap bytes.
+// *out_len always receives len(b); if the buffer is too small nothing is
+// copied and V2G_ERR_NOSPACE is returned so the caller can retry.
+//
+// NOSPACE is a routine retry signal, not a failure, so it deliberately leaves
+// the last-error state alone: setLastError frees the shared lastErrC, which
+// another thread may be reading after its own v2g_last_error() call.
+func copyToCallerBuffer(b []byte, out *C.uint8_t, out_cap C.size_t, out_len *C.size_t) C.int {
+	*out_len = C.size_t(len(b))
+	if len(b) == 0 {
+		return C.int(_v2g_ok)
+	}
+	if out == nil || C.size_t(len(b)) > out_cap {
+		return C.int(_v2g_err_nospace)
+	}
+	C.memcpy(unsafe.Pointer(out), unsafe.Pointer(&b[0]), C.size_t(len(b)))
+	return C.int(_v2g_ok)
+}
+
+// cStringFromBytes copies b into a malloc'ed NUL-terminated C string.
+// Returns nil if the allocation fails.
+func cStringFromBytes(b []byte) *C.char {
+	// Use malloc to allocate len+1 bytes and copy contents, set trailing NUL.
+	cptr := C.malloc(C.size_t(len(b) + 1))
+	if cptr == nil {
+		return nil
+	}
+	if len(b) > 0 {
+		C.memcpy(cptr, unsafe.Pointer(&b[0]), C.size_t(len(b)))
+	}
 	// Set trailing NUL (write zero at the final byte)
-	lastBytePtr := unsafe.Pointer(uintptr(cptr) + uintptr(len(xmlBytes)))
+	lastBytePtr := unsafe.Pointer(uintptr(cptr) + uintptr(len(b)))
 	*(*byte)(lastBytePtr) = 0
+	return (*C.char)(cptr)
+}
 
-	*out_xml = (*C.char)(cptr)
-	*out_len = C.size_t(len(xmlBytes))
+// freeCBuffers releases every non-nil entry of a C pointer array and resets
+// it to nil.
+func freeCBuffers(bufs []unsafe.Pointer) {
+	for i, p := range bufs {
+		if p != nil {
+			C.free(p)
+			bufs[i] = nil
+		}
+	}
+}
+
+//export v2g_encode_xml_batch
+func v2g_encode_xml_batch(xmls **C.uint8_t, lens *C.size_t, n C.size_t, out_bufs **C.uint8_t, out_lens *C.size_t) C.int {
+	if xmls == nil || lens == nil || n == 0 || out_bufs == nil || out_lens == nil {
+		setLastError("v2g_encode_xml_batch: invalid arguments")
+		return C.int(_v2g_err_invalid)
+	}
+
+	// Ensure codec initialized
+	stateMu.Lock()
+	c := codec
+	stateMu.Unlock()
+	if c == nil {
+		setLastError("v2g_encode_xml_batch: codec not initialized")
+		return C.int(_v2g_err_init)
+	}
+
+	count := int(n)
+	inputs := unsafe.Slice(xmls, count)
+	inputLens := unsafe.Slice(lens, count)
+	outputs := unsafe.Slice((*unsafe.Pointer)(unsafe.Pointer(out_bufs)), count)
+	outputLens := unsafe.Slice(out_lens, count)
+
+	for i := 0; i < count; i++ {
+		if inputs[i] == nil || inputLens[i] == 0 {
+			freeCBuffers(outputs[:i])
+			setLastError("v2g_encode_xml_batch: invalid input at index %d", i)
+			return C.int(_v2g_err_invalid)
+		}
+		input := C.GoBytes(unsafe.Pointer(inputs[i]), C.int(inputLens[i]))
+		result, err := c.EncodeXML(input)
+		if err != nil {
+			freeCBuffers(outputs[:i])
+			setLastError("encode failed at index %d: %v", i, err)
+			return C.int(_v2g_err_encode)
+		}
+		cbuf := C.CBytes(result)
+		if cbuf == nil {
+			freeCBuffers(outputs[:i])
+			setLastError("encode: out of memory")
+			return C.int(_v2g_err_oom)
+		}
+		outputs[i] = cbuf
+		outputLens[i] = C.size_t(len(result))
+	}
+	return C.int(_v2g_ok)
+}
+
+//export v2g_decode_exi_batch
+func v2g_decode_exi_batch(exis **C.uint8_t, lens *C.size_t, n C.size_t, out_xmls **C.char, out_lens *C.size_t) C.int {
+	if exis == nil || lens == nil || n == 0 || out_xmls == nil || out_lens == nil {
+		setLastError("v2g_decode_exi_batch: invalid arguments")
+		return C.int(_v2g_err_invalid)
+	}
+
+	// Ensure codec initialized
+	stateMu.Lock()
+	c := codec
+	stateMu.Unlock()
+	if c == nil {
+		setLastError("v2g_decode_exi_batch: codec not initialized")
+		return C.int(_v2g_err_init)
+	}
+
+	count := int(n)
+	inputs := unsafe.Slice(exis, count)
+	inputLens := unsafe.Slice(lens, count)
+	outputs := unsafe.Slice((*unsafe.Pointer)(unsafe.Pointer(out_xmls)), count)
+	outputLens := unsafe.Slice(out_lens, count)
+
+	for i := 0; i < count; i++ {
+		if inputs[i] == nil || inputLens[i] == 0 {
+			freeCBuffers(outputs[:i])
+			setLastError("v2g_decode_exi_batch: invalid input at index %d", i)
+			return C.int(_v2g_err_invalid)
+		}
+		input := C.GoBytes(unsafe.Pointer(inputs[i]), C.int(inputLens[i]))
+		xmlBytes, err := c.DecodeEXI(input)
+		if err != nil {
+			freeCBuffers(outputs[:i])
+			setLastError("decode failed at index %d: %v", i, err)
+			return C.int(_v2g_err_decode)
+		}
+		cptr := cStringFromBytes(xmlBytes)
+		if cptr == nil {
+			freeCBuffers(outputs[:i])
+			setLastError("decode: out of memory")
+			return C.int(_v2g_err_oom)
+		}
+		outputs[i] = unsafe.Pointer(cptr)
+		outputLens[i] = C.size_t(len(xmlBytes))
+	}
 	return C.int(_v2g_ok)
 }
 
@@ -292,6 +478,14 @@ func v2g_free_buffer(buf unsafe.Pointer) {
 	C.free(buf)
 }
 
+//export v2g_free_batch
+func v2g_free_batch(bufs *unsafe.Pointer, n C.size_t) {
+	if bufs == nil || n == 0 {
+		return
+	}
+	freeCBuffers(unsafe.Slice(bufs, int(n)))
+}
+
 //export v2g_last_error
 func v2g_last_error() *C.char {
 	// Return the last error C string (may be nil)
@@ -23,7 +23,7 @@ import "C"
 
 import (
 	"encoding/json"
-	"fmt"
+	"sync"
 	"unsafe"
 
 	"example.com/exi-go/pkg/exi"
@@ -84,8 +84,9 @@ func v2g_encode_struct(msg_type C.int, json_data *C.char, json_len C.size_t, out
 		return C.int(_v2g_err_invalid)
 	}
 
-	// Convert JSON to Go bytes
-	jsonBytes := C.GoBytes(unsafe.Pointer(json_data), C.int(json_len))
+	// View the caller's JSON in place instead of copying it; json.Unmarshal
+	// does not retain its input and the buffer is valid for the whole call.
+	jsonBytes := unsafe.Slice((*byte)(unsafe.Pointer(json_data)), int(json_len))
 
 	// Decode JSON into appropriate struct type based on msg_type
 	var result []byte
@@ -769,8 +770,22 @@ func v2g_decode_struct(msg_type C.int, exi_data *C.uint8_t, exi_len C.size_t, ou
 	return C.int(_v2g_ok)
 }
 
+// messageTypeNamesC holds the C strings handed out by v2g_message_type_name.
+// They are allocated once per message type and never freed, so callers can
+// treat them as static. Protected by messageTypeNamesMu.
+var (
+	messageTypeNamesMu sync.Mutex
+	messageTypeNamesC  = map[int]*C.char{}
+)
+
 //export v2g_message_type_name
 func v2g_message_type_name(msg_type C.int) *C.char {
+	messageTypeNamesMu.Lock()
+	defer messageTypeNamesMu.Unlock()
+	if cname, ok := messageTypeNamesC[int(msg_type)]; ok {
+		return cname
+	}
+
 	var name string
 	switch int(msg_type) {
 	case V2G_MSG_AuthorizationReq:
@@ -850,7 +865,9 @@ func v2g_message_type_name(msg_type C.int) *C.char {
 	case V2G_MSG_DC_ACDP_BPTRes:
 		name = "DC_ACDP_BPTRes"
 	default:
-		name = fmt.Sprintf("Unknown(%d)", msg_type)
+		return nil
 	}
-	return C.CString(name)
+	cname := C.CString(name)
+	messageTypeNamesC[int(msg_type)] = cname
+	return cname
 }
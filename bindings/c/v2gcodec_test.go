@@ -0,0 +1,169 @@
+package main
+
+import (
+	"bytes"
+	"encoding/xml"
+	"fmt"
+	"strings"
+	"testing"
+	"unsafe"
+
+	"example.com/exi-go/pkg/exi"
+	"example.com/exi-go/pkg/v2g/generated"
+)
+
+// initCodec brings up the exported runtime for one test and returns a
+// separate Go codec for computing expected results.
+func initCodec(t *testing.T) *exi.Codec {
+	t.Helper()
+	if rc := v2g_init(); rc != _v2g_ok {
+		t.Fatalf("v2g_init failed: %d (%s)", rc, lastError())
+	}
+	t.Cleanup(func() { v2g_shutdown() })
+
+	c := exi.NewCodec(nil)
+	if err := c.Init(); err != nil {
+		t.Fatalf("codec Init failed: %v", err)
+	}
+	t.Cleanup(func() { c.Shutdown() })
+	return c
+}
+
+// sampleXML returns a SessionSetupReq document whose EVCCID ends in id.
+func sampleXML(t *testing.T, id byte) []byte {
+	t.Helper()
+	out, err := xml.Marshal(&generated.SessionSetupReq{
+		EVCCID: []byte{0x0A, 0x1B, 0x2C, 0x3D, 0x4E, id},
+	})
+	if err != nil {
+		t.Fatalf("xml.Marshal failed: %v", err)
+	}
+	return out
+}
+
+func TestEncodeDecodeBatch(t *testing.T) {
+	c := initCodec(t)
+	xmls := [][]byte{sampleXML(t, 1), sampleXML(t, 2), sampleXML(t, 3)}
+
+	rc, outs, lens := encodeXMLBatch(xmls)
+	if rc != _v2g_ok {
+		t.Fatalf("v2g_encode_xml_batch failed: %d (%s)", rc, lastError())
+	}
+	defer freeBatch(outs)
+
+	exis := make([][]byte, len(xmls))
+	for i, in := range xmls {
+		want, err := c.EncodeXML(in)
+		if err != nil {
+			t.Fatalf("EncodeXML(%d) failed: %v", i, err)
+		}
+		exis[i] = batchOutput(outs[i], lens[i])
+		if !bytes.Equal(exis[i], want) {
+			t.Fatalf("entry %d: batch output differs from EncodeXML", i)
+		}
+	}
+
+	rc, xmlOuts, xmlLens := decodeEXIBatch(exis)
+	if rc != _v2g_ok {
+		t.Fatalf("v2g_decode_exi_batch failed: %d (%s)", rc, lastError())
+	}
+	defer freeBatch(xmlOuts)
+
+	for i, in := range exis {
+		want, err := c.DecodeEXI(in)
+		if err != nil {
+			t.Fatalf("DecodeEXI(%d) failed: %v", i, err)
+		}
+		got := batchOutput(xmlOuts[i], xmlLens[i])
+		if !bytes.Equal(got, want) {
+			t.Fatalf("entry %d: batch output differs from DecodeEXI", i)
+		}
+		// decode outputs are NUL-terminated C strings
+		if term := batchOutput(xmlOuts[i], xmlLens[i]+1)[xmlLens[i]]; term != 0 {
+			t.Fatalf("entry %d: missing NUL terminator", i)
+		}
+	}
+}
+
+// checkBatchFailure asserts that a batch call failed at index bad, released
+// the outputs produced before it and named the index in the error message.
+func checkBatchFailure(t *testing.T, name string, rc, wantRC int, outs []unsafe.Pointer, bad int) {
+	t.Helper()
+	if rc != wantRC {
+		t.Fatalf("%s: got status %d, want %d", name, rc, wantRC)
+	}
+	for i, p := range outs {
+		if p != nil {
+			t.Fatalf("%s: output %d not released after failure at index %d", name, i, bad)
+		}
+	}
+	if msg := lastError(); !strings.Contains(msg, fmt.Sprintf("index %d", bad)) {
+		t.Fatalf("%s: error %q does not name index %d", name, msg, bad)
+	}
+}
+
+func TestEncodeBatchFailureReleasesEarlierOutputs(t *testing.T) {
+	initCodec(t)
+
+	rc, outs, _ := encodeXMLBatch([][]byte{sampleXML(t, 1), sampleXML(t, 2), []byte("not xml")})
+	checkBatchFailure(t, "v2g_encode_xml_batch", rc, _v2g_err_encode, outs, 2)
+
+	rc, outs, _ = encodeXMLBatch([][]byte{sampleXML(t, 1), nil, sampleXML(t, 3)})
+	checkBatchFailure(t, "v2g_encode_xml_batch", rc, _v2g_err_invalid, outs, 1)
+}
+
+func TestDecodeBatchFailureReleasesEarlierOutputs(t *testing.T) {
+	c := initCodec(t)
+	exi, err := c.EncodeXML(sampleXML(t, 1))
+	if err != nil {
+		t.Fatalf("EncodeXML failed: %v", err)
+	}
+
+	rc, outs, _ := decodeEXIBatch([][]byte{exi, []byte("not exi")})
+	checkBatchFailure(t, "v2g_decode_exi_batch", rc, _v2g_err_decode, outs, 1)
+}
+
+func TestIntoNoSpaceReportsRequiredSize(t *testing.T) {
+	c := initCodec(t)
+	in := sampleXML(t, 1)
+	wantEXI, err := c.EncodeXML(in)
+	if err != nil {
+		t.Fatalf("EncodeXML failed: %v", err)
+	}
+	wantXML, err := c.DecodeEXI(wantEXI)
+	if err != nil {
+		t.Fatalf("DecodeEXI failed: %v", err)
+	}
+
+	cases := []struct {
+		name string
+		call func([]byte, int) (int, int, []byte)
+		in   []byte
+		want []byte
+	}{
+		{"v2g_encode_xml_into", encodeXMLInto, in, wantEXI},
+		{"v2g_decode_exi_into", decodeEXIInto, wantEXI, wantXML},
+	}
+	for _, tc := range cases {
+		// leave a known error behind; NOSPACE must not replace it
+		setLastError("previous error")
+
+		for _, outCap := range []int{0, len(tc.want) - 1} {
+			rc, n, _ := tc.call(tc.in, outCap)
+			if rc != _v2g_err_nospace {
+				t.Fatalf("%s(cap %d): got status %d, want V2G_ERR_NOSPACE", tc.name, outCap, rc)
+			}
+			if n != len(tc.want) {
+				t.Fatalf("%s(cap %d): out_len %d, want %d", tc.name, outCap, n, len(tc.want))
+			}
+		}
+		if msg := lastError(); msg != "previous error" {
+			t.Fatalf("%s: NOSPACE changed last error to %q", tc.name, msg)
+		}
+
+		rc, n, got := tc.call(tc.in, len(tc.want))
+		if rc != _v2g_ok || n != len(tc.want) || !bytes.Equal(got, tc.want) {
+			t.Fatalf("%s(exact cap): status %d, out_len %d, output mismatch", tc.name, rc, n)
+		}
+	}
+}
@@ -0,0 +1,147 @@
+/*
+cgo bridge for exi-go - Go-callable wrappers for tests
+
+cgo cannot be used from _test.go files, so v2gcodec_test.go drives the
+exported C API through the helpers below, which do the C-side allocation and
+pointer-array marshaling a real C caller would do.
+
+Build note:
+  - build.sh lists its source files explicitly and does not include this
+    file, so none of this ends up in libv2gcodec.
+
+License: Apache-2.0 (match repository)
+*/
+package main
+
+/*
+#include <stdint.h>
+#include <stdlib.h>
+*/
+import "C"
+
+import "unsafe"
+
+// batchCall adapts one of the v2g_*_batch exports to a common signature.
+type batchCall func(ins **C.uint8_t, lens *C.size_t, n C.size_t, outs *unsafe.Pointer, outLens *C.size_t) C.int
+
+// runBatch copies inputs into C memory, runs call and returns its status
+// together with the raw output pointers and lengths. An empty input is passed
+// as a NULL pointer with length 0. The outputs are owned by the caller and
+// must be released with freeBatch.
+func runBatch(inputs [][]byte, call batchCall) (int, []unsafe.Pointer, []int) {
+	n := len(inputs)
+	ptrSize := C.size_t(unsafe.Sizeof(uintptr(0)))
+	ins := (**C.uint8_t)(C.calloc(C.size_t(n), ptrSize))
+	lens := (*C.size_t)(C.calloc(C.size_t(n), C.size_t(unsafe.Sizeof(C.size_t(0)))))
+	outs := (*unsafe.Pointer)(C.calloc(C.size_t(n), ptrSize))
+	outLens := (*C.size_t)(C.calloc(C.size_t(n), C.size_t(unsafe.Sizeof(C.size_t(0)))))
+	defer C.free(unsafe.Pointer(ins))
+	defer C.free(unsafe.Pointer(lens))
+	defer C.free(unsafe.Pointer(outs))
+	defer C.free(unsafe.Pointer(outLens))
+
+	inSlice := unsafe.Slice(ins, n)
+	lenSlice := unsafe.Slice(lens, n)
+	for i, in := range inputs {
+		if len(in) == 0 {
+			continue
+		}
+		inSlice[i] = (*C.uint8_t)(C.CBytes(in))
+		lenSlice[i] = C.size_t(len(in))
+	}
+	defer func() {
+		for _, p := range inSlice {
+			if p != nil {
+				C.free(unsafe.Pointer(p))
+			}
+		}
+	}()
+
+	rc := call(ins, lens, C.size_t(n), outs, outLens)
+
+	gotOuts := make([]unsafe.Pointer, n)
+	gotLens := make([]int, n)
+	copy(gotOuts, unsafe.Slice(outs, n))
+	for i, l := range unsafe.Slice(outLens, n) {
+		gotLens[i] = int(l)
+	}
+	return int(rc), gotOuts, gotLens
+}
+
+// encodeXMLBatch runs v2g_encode_xml_batch over inputs (see runBatch).
+func encodeXMLBatch(inputs [][]byte) (int, []unsafe.Pointer, []int) {
+	return runBatch(inputs, func(ins **C.uint8_t, lens *C.size_t, n C.size_t, outs *unsafe.Pointer, outLens *C.size_t) C.int {
+		return v2g_encode_xml_batch(ins, lens, n, (**C.uint8_t)(unsafe.Pointer(outs)), outLens)
+	})
+}
+
+// decodeEXIBatch runs v2g_decode_exi_batch over inputs (see runBatch).
+func decodeEXIBatch(inputs [][]byte) (int, []unsafe.Pointer, []int) {
+	return runBatch(inputs, func(ins **C.uint8_t, lens *C.size_t, n C.size_t, outs *unsafe.Pointer, outLens *C.size_t) C.int {
+		return v2g_decode_exi_batch(ins, lens, n, (**C.char)(unsafe.Pointer(outs)), outLens)
+	})
+}
+
+// batchOutput copies one batch output buffer into Go memory.
+func batchOutput(p unsafe.Pointer, n int) []byte {
+	return C.GoBytes(p, C.int(n))
+}
+
+// freeBatch releases batch outputs through v2g_free_batch, passing them in a
+// C-allocated pointer array as a C caller would.
+func freeBatch(bufs []unsafe.Pointer) {
+	n := len(bufs)
+	arr := (*unsafe.Pointer)(C.calloc(C.size_t(n), C.size_t(unsafe.Sizeof(uintptr(0)))))
+	defer C.free(unsafe.Pointer(arr))
+	copy(unsafe.Slice(arr, n), bufs)
+	v2g_free_batch(arr, C.size_t(n))
+}
+
+// intoCall adapts one of the v2g_*_into exports to a common signature.
+type intoCall func(in *C.uint8_t, inLen C.size_t, out *C.uint8_t, outCap C.size_t, outLen *C.size_t) C.int
+
+// runInto copies input into C memory and runs call with an output buffer of
+// outCap bytes (NULL when outCap is 0). It returns the status, the reported
+// *out_len and, on success, the bytes written.
+func runInto(input []byte, outCap int, call intoCall) (int, int, []byte) {
+	in := C.CBytes(input)
+	defer C.free(in)
+	var out unsafe.Pointer
+	if outCap > 0 {
+		out = C.malloc(C.size_t(outCap))
+		defer C.free(out)
+	}
+	outLen := (*C.size_t)(C.malloc(C.size_t(unsafe.Sizeof(C.size_t(0)))))
+	defer C.free(unsafe.Pointer(outLen))
+	*outLen = 0
+
+	rc := call((*C.uint8_t)(in), C.size_t(len(input)), (*C.uint8_t)(out), C.size_t(outCap), outLen)
+	n := int(*outLen)
+	if rc != _v2g_ok || n == 0 {
+		return int(rc), n, nil
+	}
+	return int(rc), n, C.GoBytes(out, C.int(n))
+}
+
+// encodeXMLInto runs v2g_encode_xml_into (see runInto).
+func encodeXMLInto(input []byte, outCap int) (int, int, []byte) {
+	return runInto(input, outCap, func(in *C.uint8_t, inLen C.size_t, out *C.uint8_t, outCap C.size_t, outLen *C.size_t) C.int {
+		return v2g_encode_xml_into(in, inLen, out, outCap, outLen)
+	})
+}
+
+// decodeEXIInto runs v2g_decode_exi_into (see runInto).
+func decodeEXIInto(input []byte, outCap int) (int, int, []byte) {
+	return runInto(input, outCap, func(in *C.uint8_t, inLen C.size_t, out *C.uint8_t, outCap C.size_t, outLen *C.size_t) C.int {
+		return v2g_decode_exi_into(in, inLen, out, outCap, outLen)
+	})
+}
+
+// lastError returns the current v2g_last_error() string, or "" if unset.
+func lastError() string {
+	p := v2g_last_error()
+	if p == nil {
+		return ""
+	}
+	return C.GoString(p)
+}
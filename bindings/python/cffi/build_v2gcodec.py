@@ -0,0 +1,43 @@
+"""
+cffi out-of-line API build script for the exi-go v2g EXI codec.
+
+Compiles a small CPython extension module (`_v2gcodec`) that links directly
+against libv2gcodec. Calls made through the compiled module go through
+statically-typed C stubs instead of libffi, which removes the per-call type
+marshaling cost of the ABI (`ffi.dlopen`) mode used as a fallback by
+v2gcodec_cffi.
+
+Usage:
+    cd bindings/c && ./build.sh           # builds lib/libv2gcodec.*
+    cd ../python/cffi
+    python3 build_v2gcodec.py             # writes _v2gcodec.*.so next to this file
+
+At runtime the dynamic loader must be able to find libv2gcodec (e.g. via
+LD_LIBRARY_PATH / DYLD_LIBRARY_PATH or a system-wide install).
+
+The generated stubs already wrap every call in Py_BEGIN_ALLOW_THREADS /
+Py_END_ALLOW_THREADS, so encode/decode calls from several Python threads run
+concurrently in the Go runtime; no extra nogil wrappers are needed here.
+"""
+
+import os
+
+from cffi import FFI
+
+from v2gcodec_cffi import CDEF
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_C_DIR = os.path.join(_HERE, os.pardir, os.pardir, "c")
+
+ffibuilder = FFI()
+ffibuilder.cdef(CDEF)
+ffibuilder.set_source(
+    "_v2gcodec",
+    '#include "v2gcodec.h"',
+    libraries=["v2gcodec"],
+    include_dirs=[os.path.join(_C_DIR, "include")],
+    library_dirs=[os.path.join(_C_DIR, "lib")],
+)
+
+if __name__ == "__main__":
+    ffibuilder.compile(tmpdir=_HERE, verbose=True)
@@ -18,23 +18,43 @@ Usage (example):
 
 The wrapper looks for the shared library in the following order:
   - Path in environment variable V2G_CODEC_LIBRARY
+  - The compiled _v2gcodec extension module (see build_v2gcodec.py)
   - libv2gcodec.so (Linux)
   - libv2gcodec.dylib (macOS)
   - v2gcodec.dll (Windows)
 You can pass an explicit path when constructing V2GCodec.
 """
 
+import asyncio
 import os
 import sys
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 
 from cffi import FFI
 
-ffi = FFI()
+# orjson (optional) serializes straight to bytes in C; fall back to stdlib json.
+try:
+    import orjson
 
-# C function declarations (keep in sync with exi-go/bindings/c/include/v2gcodec.h)
-ffi.cdef("""
-    typedef unsigned long size_t; /* ensure size_t is available to cffi */
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
 
+    # compact separators: no whitespace for the Go side to skip
+    _json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    def _json_dumps(obj) -> bytes:
+        return _json_encode(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+# C function declarations (keep in sync with exi-go/bindings/c/include/v2gcodec.h).
+# Shared with build_v2gcodec.py, which compiles them into the _v2gcodec module.
+CDEF = """
     int v2g_init(void);
     int v2g_shutdown(void);
     int v2g_load_schemas(const char** paths, size_t count);
@@ -47,11 +67,160 @@ ffi.cdef("""
     int v2g_decode_struct(int msg_type, const unsigned char* exi_data, size_t exi_len,
                           char** out_json, size_t* out_len);
     const char* v2g_message_type_name(int msg_type);
+    int v2g_encode_xml_into(const unsigned char* xml, size_t xml_len,
+                            unsigned char* out, size_t out_cap, size_t* out_len);
+    int v2g_decode_exi_into(const unsigned char* exi, size_t exi_len,
+                            unsigned char* out, size_t out_cap, size_t* out_len);
+    int v2g_encode_xml_batch(const unsigned char** xmls, const size_t* lens, size_t n,
+                             unsigned char** out_bufs, size_t* out_lens);
+    int v2g_decode_exi_batch(const unsigned char** exis, const size_t* lens, size_t n,
+                             char** out_xmls, size_t* out_lens);
     void v2g_free_buffer(void* buf);
+    void v2g_free_batch(void** bufs, size_t n);
     const char* v2g_last_error(void);
     const char* v2g_version(void);
     int v2g_set_option(const char* name, const char* value);
-""")
+"""
+
+# Prefer the precompiled out-of-line API module (see build_v2gcodec.py); it
+# calls into libv2gcodec through static C stubs instead of libffi. Fall back to
+# ABI mode (ffi.dlopen) when it has not been built.
+try:
+    from _v2gcodec import ffi, lib as _compiled_lib
+except ImportError:
+    _compiled_lib = None
+    ffi = FFI()
+    ffi.cdef(CDEF)
+
+# Bound once so the call paths below skip the ffi attribute lookups.
+_NULL = ffi.NULL
+_new = ffi.new
+_buffer = ffi.buffer
+_from_buffer = ffi.from_buffer
+
+# Input types accepted by encode/decode. The isinstance checks against this
+# run only in debug mode (they are stripped under python -O).
+_BYTES_LIKE = (bytes, bytearray, memoryview)
+
+# Fallback messages used when the library provides no usable error string.
+_UNKNOWN_ERROR = "unknown error"
+_INVALID_ERROR_STRING = "<invalid error string>"
+
+# Status returned by the *_into functions when the output buffer is too small.
+_V2G_ERR_NOSPACE = 8
+
+
+def _in_buf(data):
+    """Return ``data`` in a form cffi accepts for a ``const unsigned char*``.
+
+    cffi passes a ``bytes`` object's internal buffer straight through, so the
+    common case skips ``ffi.from_buffer`` and its cdata allocation. Exact type
+    check: subclasses and other buffers go through the buffer protocol.
+    """
+    if type(data) is bytes:
+        return data
+    return _from_buffer("unsigned char[]", data)
+
+
+# Out-parameter cdata reused across encode/decode calls instead of being
+# allocated per call. Each thread keeps its own deque of slots.
+_PoolSlot = namedtuple("_PoolSlot", "out_exi out_str out_len")
+_tls = threading.local()
+
+
+def _acquire() -> _PoolSlot:
+    """Take an out-parameter slot from the calling thread's pool."""
+    try:
+        slots = _tls.slots
+    except AttributeError:
+        slots = _tls.slots = deque()
+    if slots:
+        return slots.pop()
+    return _PoolSlot(_new("unsigned char**"), _new("char**"), _new("size_t*"))
+
+
+def _release(slot: _PoolSlot):
+    """Return a slot to the calling thread's pool."""
+    # callers treat a zero length as "no output", so a stale pointer is never read
+    slot.out_len[0] = 0
+    _tls.slots.append(slot)
+
+
+class _BufPool:
+    """Per-thread pool of reusable output bytearrays in fixed size buckets."""
+
+    _BUCKETS = (4 * 1024, 64 * 1024, 1024 * 1024)
+
+    def __init__(self):
+        self._tls = threading.local()
+
+    def _free_lists(self):
+        try:
+            return self._tls.free
+        except AttributeError:
+            free = self._tls.free = {bucket: [] for bucket in self._BUCKETS}
+            return free
+
+    def acquire(self, size: int) -> bytearray:
+        """Return a buffer of at least `size` bytes."""
+        for bucket in self._BUCKETS:
+            if size <= bucket:
+                free = self._free_lists()[bucket]
+                return free.pop() if free else bytearray(bucket)
+        # too large to keep around
+        return bytearray(size)
+
+    def release(self, buf):
+        """Hand a buffer obtained from acquire() back to the pool."""
+        if type(buf) is bytearray:
+            free = self._free_lists().get(len(buf))
+            if free is not None:
+                free.append(buf)
+
+
+_buf_pool = _BufPool()
+
+
+class PooledBytes:
+    """
+    Encode/decode result held in a pooled output buffer.
+
+    Use it as a context manager; the buffer goes back to the pool on exit and
+    the view must not be used afterwards:
+
+        with codec.encode_xml_view(xml) as view:
+            sock.sendall(view)
+
+    In a steady-state loop this reuses the same buffers instead of allocating
+    a new one per call. Call tobytes() to keep a copy beyond the block.
+    """
+
+    __slots__ = ("_buf", "view")
+
+    def __init__(self, buf, length: int):
+        self._buf = buf
+        self.view = memoryview(buf)[:length]
+
+    def __enter__(self) -> memoryview:
+        return self.view
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def tobytes(self) -> bytes:
+        return self.view.tobytes()
+
+    def release(self):
+        """Return the buffer to the pool. Safe to call more than once."""
+        if self._buf is None:
+            return
+        self.view.release()
+        _buf_pool.release(self._buf)
+        self._buf = None
+
 
 # Default library names to try if none provided.
 _DEFAULT_LIB_CANDIDATES = [
@@ -60,9 +229,24 @@ _DEFAULT_LIB_CANDIDATES = [
     "v2gcodec.dll",  # Windows
 ]
 
+# Libraries opened through ffi.dlopen, keyed by the name or path used to open
+# them, so every V2GCodec in the process shares a single handle per library.
+_LIB_CACHE = {}
+_LIB_CACHE_LOCK = threading.Lock()
+
+
+def _load_lib(path: str):
+    """Return the ffi.dlopen handle for path, opening it on first use."""
+    with _LIB_CACHE_LOCK:
+        lib = _LIB_CACHE.get(path)
+        if lib is None:
+            # raises OSError if the library cannot be loaded
+            lib = _LIB_CACHE[path] = ffi.dlopen(path)
+        return lib
+
 
 # ISO 15118-20 message type constants
-class MessageType:
+class MessageType(IntEnum):
     """Message type constants for ISO 15118-20."""
 
     # Common messages (all services)
@@ -110,6 +294,10 @@ class MessageType:
     DC_ACDP_BPTRes = 62
 
 
+# Message type id -> name, so message_type_name() needs no FFI call for known ids.
+_MSG_NAMES = {m.value: m.name for m in MessageType}
+
+
 class V2GError(RuntimeError):
     """Base exception for v2g codec errors."""
 
@@ -126,16 +314,20 @@ class V2GCodec:
         Load the shared library.
 
         :param lib_path: Optional explicit path to the shared library. If None,
-                         the wrapper searches environment variables and defaults.
+                         the wrapper uses the environment variable, then the
+                         compiled _v2gcodec module, then default names.
         """
         lib_path = lib_path or os.environ.get("V2G_CODEC_LIBRARY")
         self._lib = None
 
         tried = []
-        if lib_path:
+        if not lib_path and _compiled_lib is not None:
+            # out-of-line API mode: already linked against libv2gcodec
+            self._lib = _compiled_lib
+        elif lib_path:
             tried.append(lib_path)
             try:
-                self._lib = ffi.dlopen(lib_path)
+                self._lib = _load_lib(lib_path)
             except OSError as e:
                 raise V2GError(f"failed to load library at {lib_path}: {e}") from e
         else:
@@ -143,22 +335,37 @@ class V2GCodec:
             for name in _DEFAULT_LIB_CANDIDATES:
                 tried.append(name)
                 try:
-                    self._lib = ffi.dlopen(name)
+                    self._lib = _load_lib(name)
                     break
                 except OSError:
                     continue
         if self._lib is None:
             raise V2GError(f"could not load v2g codec library; tried: {tried}")
 
+        # Resolve the hot-path functions once instead of on every call.
+        lib = self._lib
+        self._c_encode_xml = lib.v2g_encode_xml
+        self._c_decode_exi = lib.v2g_decode_exi
+        self._c_encode_struct = lib.v2g_encode_struct
+        self._c_decode_struct = lib.v2g_decode_struct
+        self._c_free = lib.v2g_free_buffer
+        # libraries built before the *_into functions existed lack the symbols
+        self._c_encode_xml_into = getattr(lib, "v2g_encode_xml_into", None)
+        self._c_decode_exi_into = getattr(lib, "v2g_decode_exi_into", None)
+
+        # worker threads for the *_async methods, created on first use
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
     # ---- low-level helpers ----
     def _last_error(self) -> str:
         p = self._lib.v2g_last_error()
-        if p == ffi.NULL:
-            return "unknown error"
+        if p == _NULL:
+            return _UNKNOWN_ERROR
         try:
             return ffi.string(p).decode("utf-8", errors="replace")
         except Exception:
-            return "<invalid error string>"
+            return _INVALID_ERROR_STRING
 
     def _check_status(self, code: int, context: str = ""):
         if code == 0:
@@ -177,13 +384,18 @@ class V2GCodec:
 
     def shutdown(self):
         """Shutdown the codec runtime and free resources."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            # let in-flight async calls finish before the runtime goes away
+            pool.shutdown(wait=True)
         rc = self._lib.v2g_shutdown()
         self._check_status(rc, "v2g_shutdown")
 
     def version(self) -> str:
         """Return the library version string."""
         p = self._lib.v2g_version()
-        if p == ffi.NULL:
+        if p == _NULL:
             return "unknown"
         return ffi.string(p).decode("utf-8", errors="replace")
 
@@ -201,13 +413,16 @@ class V2GCodec:
         """
         if not paths:
             raise ValueError("paths must be a non-empty iterable of file paths")
+        encoded = [None if p is None else p.encode("utf-8") for p in paths]
+        # Pack every path into one NUL-separated buffer and point into it,
+        # rather than allocating a separate char[] per path.
+        joined = _new("char[]", b"\x00".join(e or b"" for e in encoded) + b"\x00")
         arr = []
-        for p in paths:
-            if p is None:
-                arr.append(ffi.NULL)
-            else:
-                arr.append(ffi.new("char[]", p.encode("utf-8")))
-        c_array = ffi.new("char*[]", arr)
+        off = 0
+        for e in encoded:
+            arr.append(_NULL if e is None else joined + off)
+            off += len(e or b"") + 1
+        c_array = _new("char*[]", arr)
         rc = self._lib.v2g_load_schemas(c_array, len(arr))
         self._check_status(rc, "v2g_load_schemas")
 
@@ -216,57 +431,254 @@ class V2GCodec:
         """
         Encode XML bytes into EXI bytes.
 
-        :param xml_bytes: bytes containing UTF-8 XML
+        :param xml_bytes: bytes-like object containing UTF-8 XML
         :returns: EXI payload as bytes
         :raises V2GError on failure
         """
-        if not isinstance(xml_bytes, (bytes, bytearray)):
-            raise TypeError("xml_bytes must be bytes")
-        in_buf = ffi.from_buffer(xml_bytes)
-        out_exi_ptr = ffi.new("unsigned char**")
-        out_len = ffi.new("size_t*")
-        rc = self._lib.v2g_encode_xml(in_buf, len(xml_bytes), out_exi_ptr, out_len)
-        if rc != 0:
-            self._check_status(rc, "v2g_encode_xml")
-        # out_exi_ptr[0] is a pointer to heap memory allocated by library
-        out_ptr = out_exi_ptr[0]
-        length = int(out_len[0])
-        if out_ptr == ffi.NULL or length == 0:
+        if __debug__ and not isinstance(xml_bytes, _BYTES_LIKE):
+            raise TypeError("xml_bytes must be a bytes-like object")
+        if self._c_encode_xml_into is not None:
+            # no C-side allocation, so no v2g_free_buffer crossing either
+            buf, n = self._encode_xml_pooled(xml_bytes)
+            exi = bytes(memoryview(buf)[:n])
+            _buf_pool.release(buf)
+            return exi
+        in_buf = _in_buf(xml_bytes)
+        slot = _acquire()
+        try:
+            rc = self._c_encode_xml(in_buf, len(in_buf), slot.out_exi, slot.out_len)
+            if rc != 0:
+                self._check_status(rc, "v2g_encode_xml")
+            # out_exi[0] is a pointer to heap memory allocated by library
+            out_ptr = slot.out_exi[0]
+            length = int(slot.out_len[0])
+        finally:
+            _release(slot)
+        if out_ptr == _NULL or length == 0:
             # still consider it success but return empty bytes
             return b""
         try:
-            result = bytes(ffi.buffer(out_ptr, length))
+            result = bytes(_buffer(out_ptr, length))
             return result
         finally:
             # free the buffer allocated by the C library
-            self._lib.v2g_free_buffer(out_ptr)
+            self._c_free(out_ptr)
 
     def decode_exi(self, exi_bytes: bytes) -> str:
         """
         Decode EXI bytes into an XML UTF-8 string.
 
-        :param exi_bytes: EXI payload bytes
+        :param exi_bytes: EXI payload (bytes, bytearray or memoryview)
         :returns: decoded XML string (UTF-8)
         """
-        if not isinstance(exi_bytes, (bytes, bytearray)):
-            raise TypeError("exi_bytes must be bytes")
-        in_buf = ffi.from_buffer(exi_bytes)
-        out_xml_ptr = ffi.new("char**")
-        out_len = ffi.new("size_t*")
-        rc = self._lib.v2g_decode_exi(in_buf, len(exi_bytes), out_xml_ptr, out_len)
-        if rc != 0:
-            self._check_status(rc, "v2g_decode_exi")
-        out_ptr = out_xml_ptr[0]
-        length = int(out_len[0])
-        if out_ptr == ffi.NULL or length == 0:
+        if __debug__ and not isinstance(exi_bytes, _BYTES_LIKE):
+            raise TypeError("exi_bytes must be a bytes-like object")
+        # Not routed through v2g_decode_exi_into: the decoded size is unknown
+        # up front and EXI often compresses more than any fixed ratio, so a
+        # too-small guess would make the library decode everything twice.
+        in_buf = _in_buf(exi_bytes)
+        slot = _acquire()
+        try:
+            rc = self._c_decode_exi(in_buf, len(in_buf), slot.out_str, slot.out_len)
+            if rc != 0:
+                self._check_status(rc, "v2g_decode_exi")
+            out_ptr = slot.out_str[0]
+            length = int(slot.out_len[0])
+        finally:
+            _release(slot)
+        if out_ptr == _NULL or length == 0:
             return ""
         try:
-            # out_ptr is a NUL-terminated C string (but length is also provided)
-            b = bytes(ffi.buffer(out_ptr, length))
-            return b.decode("utf-8", errors="replace")
+            # decode straight from the C buffer; no intermediate bytes copy
+            return str(_buffer(out_ptr, length), "utf-8", "replace")
         finally:
             # free the returned string pointer
-            self._lib.v2g_free_buffer(out_ptr)
+            self._c_free(out_ptr)
+
+    # ---- encode / decode into Python-owned buffers ----
+    def _call_into(self, fn, data, size_hint: int, context: str):
+        """
+        Run a *_into function, growing the output buffer once if needed.
+
+        Returns ``(buf, n)``: a buffer from _buf_pool holding the n-byte result.
+        The caller must hand buf back to _buf_pool once done with it.
+        """
+        in_buf = _in_buf(data)
+        slot = _acquire()
+        buf = _buf_pool.acquire(size_hint)
+        try:
+            out = _from_buffer("unsigned char[]", buf, require_writable=True)
+            rc = fn(in_buf, len(in_buf), out, len(buf), slot.out_len)
+            if rc == _V2G_ERR_NOSPACE:
+                # out_len holds the required size
+                _buf_pool.release(buf)
+                buf = _buf_pool.acquire(int(slot.out_len[0]))
+                out = _from_buffer("unsigned char[]", buf, require_writable=True)
+                rc = fn(in_buf, len(in_buf), out, len(buf), slot.out_len)
+            if rc != 0:
+                _buf_pool.release(buf)
+                self._check_status(rc, context)
+            return buf, int(slot.out_len[0])
+        finally:
+            _release(slot)
+
+    def _encode_xml_pooled(self, xml_bytes):
+        # EXI output is normally smaller than the XML input
+        return self._call_into(
+            self._c_encode_xml_into,
+            xml_bytes,
+            max(len(xml_bytes), 64),
+            "v2g_encode_xml_into",
+        )
+
+    def _decode_exi_pooled(self, exi_bytes):
+        return self._call_into(
+            self._c_decode_exi_into,
+            exi_bytes,
+            max(len(exi_bytes) * 8, 4096),
+            "v2g_decode_exi_into",
+        )
+
+    def encode_xml_view(self, xml_bytes: bytes) -> PooledBytes:
+        """
+        Encode XML bytes into EXI without an intermediate C-allocated buffer.
+
+        :param xml_bytes: bytes-like object containing UTF-8 XML
+        :returns: PooledBytes holding the EXI payload; use it as a context
+                  manager to get a memoryview and recycle the buffer
+        :raises V2GError on failure
+        """
+        if __debug__ and not isinstance(xml_bytes, _BYTES_LIKE):
+            raise TypeError("xml_bytes must be a bytes-like object")
+        if self._c_encode_xml_into is None:
+            exi = self.encode_xml(xml_bytes)
+            return PooledBytes(exi, len(exi))
+        return PooledBytes(*self._encode_xml_pooled(xml_bytes))
+
+    def decode_exi_view(self, exi_bytes: bytes) -> PooledBytes:
+        """
+        Decode EXI bytes into XML without an intermediate C-allocated buffer.
+
+        If the XML does not fit the initial buffer (8x the input, at least
+        4 KiB) the library runs the decode a second time into a larger one.
+
+        :param exi_bytes: EXI payload (bytes, bytearray or memoryview)
+        :returns: PooledBytes holding the UTF-8 XML; use it as a context
+                  manager to get a memoryview and recycle the buffer
+        :raises V2GError on failure
+        """
+        if __debug__ and not isinstance(exi_bytes, _BYTES_LIKE):
+            raise TypeError("exi_bytes must be a bytes-like object")
+        if self._c_decode_exi_into is None:
+            xml = self.decode_exi(exi_bytes).encode("utf-8")
+            return PooledBytes(xml, len(xml))
+        return PooledBytes(*self._decode_exi_pooled(exi_bytes))
+
+    # ---- asyncio encode / decode ----
+    def _executor(self) -> ThreadPoolExecutor:
+        # always under the lock, so a concurrent shutdown() can never make this
+        # return None or a pool it has already detached
+        with self._pool_lock:
+            pool = self._pool
+            if pool is None:
+                pool = self._pool = ThreadPoolExecutor(
+                    max_workers=os.cpu_count(), thread_name_prefix="v2gcodec"
+                )
+            return pool
+
+    async def encode_xml_async(self, xml_bytes: bytes) -> bytes:
+        """
+        Encode XML bytes into EXI on a worker thread.
+
+        The GIL is released while the library runs, so concurrent calls
+        proceed in parallel and the event loop stays responsive.
+
+        :param xml_bytes: bytes-like object containing UTF-8 XML
+        :returns: EXI payload as bytes
+        :raises V2GError on failure
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor(), self.encode_xml, xml_bytes)
+
+    async def decode_exi_async(self, exi_bytes: bytes) -> str:
+        """
+        Decode EXI bytes into an XML string on a worker thread.
+
+        :param exi_bytes: EXI payload (bytes, bytearray or memoryview)
+        :returns: decoded XML string (UTF-8)
+        :raises V2GError on failure
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor(), self.decode_exi, exi_bytes)
+
+    # ---- batch encode / decode ----
+    def _batch_inputs(self, items, name: str):
+        """Build the input pointer and length arrays for a batch call."""
+        bufs = []
+        for item in items:
+            if __debug__ and not isinstance(item, _BYTES_LIKE):
+                raise TypeError(f"{name} entries must be bytes-like objects")
+            bufs.append(_from_buffer("unsigned char[]", item))
+        # bufs must stay referenced until the FFI call returns
+        return (
+            bufs,
+            _new("const unsigned char*[]", bufs),
+            _new("size_t[]", [len(b) for b in bufs]),
+        )
+
+    def encode_xml_batch(self, xml_list) -> list:
+        """
+        Encode many XML documents into EXI with a single FFI call.
+
+        :param xml_list: sequence of bytes-like objects containing UTF-8 XML
+        :returns: list of EXI payloads as bytes, in input order
+        :raises V2GError on failure (no partial results are returned)
+        """
+        n = len(xml_list)
+        if n == 0:
+            return []
+        _keep, in_bufs, in_lens = self._batch_inputs(xml_list, "xml_list")
+        out_bufs = _new("unsigned char*[]", n)
+        out_lens = _new("size_t[]", n)
+        rc = self._lib.v2g_encode_xml_batch(in_bufs, in_lens, n, out_bufs, out_lens)
+        if rc != 0:
+            self._check_status(rc, "v2g_encode_xml_batch")
+        try:
+            return [
+                bytes(_buffer(out_bufs[i], out_lens[i])) if out_lens[i] else b""
+                for i in range(n)
+            ]
+        finally:
+            self._lib.v2g_free_batch(ffi.cast("void**", out_bufs), n)
+
+    def decode_exi_batch(self, exi_list) -> list:
+        """
+        Decode many EXI payloads into XML strings with a single FFI call.
+
+        :param exi_list: sequence of bytes-like EXI payloads
+        :returns: list of decoded XML strings, in input order
+        :raises V2GError on failure (no partial results are returned)
+        """
+        n = len(exi_list)
+        if n == 0:
+            return []
+        _keep, in_bufs, in_lens = self._batch_inputs(exi_list, "exi_list")
+        out_xmls = _new("char*[]", n)
+        out_lens = _new("size_t[]", n)
+        rc = self._lib.v2g_decode_exi_batch(in_bufs, in_lens, n, out_xmls, out_lens)
+        if rc != 0:
+            self._check_status(rc, "v2g_decode_exi_batch")
+        try:
+            return [
+                (
+                    str(_buffer(out_xmls[i], out_lens[i]), "utf-8", "replace")
+                    if out_lens[i]
+                    else ""
+                )
+                for i in range(n)
+            ]
+        finally:
+            self._lib.v2g_free_batch(ffi.cast("void**", out_xmls), n)
 
     # ---- native struct encode/decode ----
     def encode_struct(self, msg_type: int, data: dict) -> bytes:
@@ -278,70 +690,65 @@ class V2GCodec:
         :returns: EXI payload as bytes
         :raises V2GError on failure
         """
-        import json
-
-        if not isinstance(data, dict):
+        if __debug__ and not isinstance(data, dict):
             raise TypeError("data must be a dictionary")
 
-        json_str = json.dumps(data)
-        json_bytes = json_str.encode("utf-8")
-
-        in_buf = ffi.from_buffer(json_bytes)
-        out_exi_ptr = ffi.new("unsigned char**")
-        out_len = ffi.new("size_t*")
-
-        rc = self._lib.v2g_encode_struct(
-            msg_type, in_buf, len(json_bytes), out_exi_ptr, out_len
-        )
-        if rc != 0:
-            self._check_status(rc, "v2g_encode_struct")
+        json_bytes = _json_dumps(data)
 
-        out_ptr = out_exi_ptr[0]
-        length = int(out_len[0])
-        if out_ptr == ffi.NULL or length == 0:
+        # json_bytes is always bytes, which cffi passes as const char* as-is
+        slot = _acquire()
+        try:
+            rc = self._c_encode_struct(
+                msg_type, json_bytes, len(json_bytes), slot.out_exi, slot.out_len
+            )
+            if rc != 0:
+                self._check_status(rc, "v2g_encode_struct")
+
+            out_ptr = slot.out_exi[0]
+            length = int(slot.out_len[0])
+        finally:
+            _release(slot)
+        if out_ptr == _NULL or length == 0:
             return b""
 
         try:
-            result = bytes(ffi.buffer(out_ptr, length))
+            result = bytes(_buffer(out_ptr, length))
             return result
         finally:
-            self._lib.v2g_free_buffer(out_ptr)
+            self._c_free(out_ptr)
 
     def decode_struct(self, msg_type: int, exi_bytes: bytes) -> dict:
         """
         Decode EXI bytes directly to a message structure.
 
         :param msg_type: Message type constant from MessageType class
-        :param exi_bytes: EXI payload bytes
+        :param exi_bytes: EXI payload (bytes, bytearray or memoryview)
         :returns: Dictionary containing the decoded message structure
         :raises V2GError on failure
         """
-        import json
+        if __debug__ and not isinstance(exi_bytes, _BYTES_LIKE):
+            raise TypeError("exi_bytes must be a bytes-like object")
 
-        if not isinstance(exi_bytes, (bytes, bytearray)):
-            raise TypeError("exi_bytes must be bytes")
-
-        in_buf = ffi.from_buffer(exi_bytes)
-        out_json_ptr = ffi.new("char**")
-        out_len = ffi.new("size_t*")
-
-        rc = self._lib.v2g_decode_struct(
-            msg_type, in_buf, len(exi_bytes), out_json_ptr, out_len
-        )
-        if rc != 0:
-            self._check_status(rc, "v2g_decode_struct")
-
-        out_ptr = out_json_ptr[0]
-        length = int(out_len[0])
-        if out_ptr == ffi.NULL or length == 0:
+        in_buf = _in_buf(exi_bytes)
+        slot = _acquire()
+        try:
+            rc = self._c_decode_struct(
+                msg_type, in_buf, len(in_buf), slot.out_str, slot.out_len
+            )
+            if rc != 0:
+                self._check_status(rc, "v2g_decode_struct")
+
+            out_ptr = slot.out_str[0]
+            length = int(slot.out_len[0])
+        finally:
+            _release(slot)
+        if out_ptr == _NULL or length == 0:
             return {}
 
         try:
-            json_bytes = bytes(ffi.buffer(out_ptr, length))
-            json_str = json_bytes.decode("utf-8", errors="replace")
-            return json.loads(json_str)
+            return _json_loads(bytes(_buffer(out_ptr, length)))
         finally:
-            self._lib.v2g_free_buffer(out_ptr)
+            self._c_free(out_ptr)
 
     def message_type_name(self, msg_type: int) -> str:
         """
@@ -350,14 +757,17 @@ class V2GCodec:
         :param msg_type: Message type constant
         :returns: Message type name string
         """
+        return _MSG_NAMES.get(msg_type) or self._ffi_message_type_name(msg_type)
+
+    def _ffi_message_type_name(self, msg_type: int) -> str:
+        """Ask the library for a name not known to MessageType."""
+        # MessageType mirrors every id the library knows, so this is only
+        # reached for unknown ids (NULL) or a library newer than this module
         p = self._lib.v2g_message_type_name(msg_type)
-        if p == ffi.NULL:
+        if p == _NULL:
             return f"Unknown({msg_type})"
-        try:
-            name = ffi.string(p).decode("utf-8", errors="replace")
-            return name
-        finally:
-            self._lib.v2g_free_buffer(p)
+        # p points at a string owned by the library; it must not be freed
+        return ffi.string(p).decode("utf-8", errors="replace")
 
 
 # Simple CLI demonstration when executed directly